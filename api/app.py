@@ -8,6 +8,7 @@ from werkzeug.exceptions import HTTPException
 
 from .config import resolve_database_uri
 from .db import db
+from .denylist import TokenDenylist
 from .routes import auth_bp, health_bp, todos_bp
 
 
@@ -31,7 +32,10 @@ def create_app(test_config=None):
         app.config.get("SQLALCHEMY_DATABASE_URI")
     )
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    app.config.setdefault("JWT_ACCESS_TOKEN_EXPIRES", timedelta(hours=4))
+    app.config.setdefault("JWT_ACCESS_TOKEN_EXPIRES", timedelta(minutes=15))
+    app.config.setdefault("JWT_REFRESH_TOKEN_EXPIRES", timedelta(days=30))
+    app.config.setdefault("TOKEN_DENYLIST_SYNC_INTERVAL", timedelta(seconds=5))
+    app.config.setdefault("TOKEN_DENYLIST_FULL_SYNC_INTERVAL", timedelta(minutes=5))
 
     frontend_origin = os.environ.get("FRONTEND_ORIGIN")
     if frontend_origin:
@@ -40,7 +44,18 @@ def create_app(test_config=None):
         CORS(app)
 
     db.init_app(app)
-    JWTManager(app)
+    jwt = JWTManager(app)
+
+    # Revocation check runs on every @jwt_required() request, so it must not hit the DB.
+    denylist = TokenDenylist(
+        app.config["TOKEN_DENYLIST_SYNC_INTERVAL"],
+        app.config["TOKEN_DENYLIST_FULL_SYNC_INTERVAL"],
+    )
+    app.extensions["token_denylist"] = denylist
+
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        return denylist.is_revoked(jwt_payload["jti"])
 
     @app.errorhandler(Exception)
     def handle_error(e):
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from .db import db
+from .models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class TokenDenylist:
+    """Revoked JWT ids, kept in memory and mirrored from ``revoked_tokens``.
+
+    ``is_revoked`` is a set lookup. Once per ``sync_interval`` one request per
+    worker also reads the rows added since the last sync (amortized, not zero, DB
+    cost); every ``full_sync_interval`` the set is reloaded and expired rows are
+    deleted from the table.
+
+    A revocation made by another worker usually takes effect within
+    ``sync_interval``. If its row commits after a row with a higher id was already
+    synced, only the next full reload sees it, so the worst case is
+    ``full_sync_interval``. If the DB is unavailable the last snapshot keeps being
+    used.
+    """
+
+    def __init__(
+        self,
+        sync_interval: timedelta = timedelta(seconds=5),
+        full_sync_interval: timedelta = timedelta(minutes=5),
+    ) -> None:
+        self.sync_interval = sync_interval.total_seconds()
+        self.full_sync_interval = full_sync_interval.total_seconds()
+
+        self._revoked: dict[str, datetime] = {}
+        self._last_id = 0
+        self._next_sync = 0.0
+        self._next_full_sync = 0.0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        # Only one thread syncs; the others read the current snapshot meanwhile.
+        if time.monotonic() >= self._next_sync and self._lock.acquire(blocking=False):
+            try:
+                if time.monotonic() >= self._next_sync:
+                    self._sync_or_keep_snapshot()
+            finally:
+                self._lock.release()
+        return jti in self._revoked
+
+    def _sync_or_keep_snapshot(self) -> None:
+        try:
+            self._sync()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            self._next_sync = time.monotonic() + self.sync_interval
+            logger.warning("Token denylist sync failed, using last snapshot: %s", e)
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        now = datetime.now(timezone.utc)
+        mono = time.monotonic()
+        # Serial ids can commit out of order, so an incremental sync may miss a
+        # row; the periodic full reload picks it up.
+        full = mono >= self._next_full_sync
+        stmt = select(
+            RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at
+        ).where(RevokedToken.expires_at > now)
+        if full:
+            # Expired tokens are rejected by their exp claim; the rows are dead weight.
+            db.session.execute(
+                delete(RevokedToken).where(RevokedToken.expires_at <= now)
+            )
+            db.session.commit()
+        else:
+            stmt = stmt.where(RevokedToken.id > self._last_id)
+        rows = db.session.execute(stmt).all()
+
+        revoked = {} if full else self._revoked
+        for row_id, jti, expires_at in rows:
+            revoked[jti] = expires_at
+            self._last_id = max(self._last_id, row_id)
+        self._revoked = revoked
+
+        self._next_sync = mono + self.sync_interval
+        if full:
+            self._next_full_sync = mono + self.full_sync_interval
+
+    def revoke(self, claims: dict) -> bool:
+        """Persist a token's jti as revoked.
+
+        Returns False if it was already revoked (e.g. a refresh token replayed
+        against another worker), which the unique index on ``jti`` detects.
+        """
+        jti = claims["jti"]
+        expires_at = datetime.fromtimestamp(claims["exp"], timezone.utc)
+        db.session.add(
+            RevokedToken(jti=jti, user_id=int(claims["sub"]), expires_at=expires_at)
+        )
+        try:
+            db.session.commit()
+            revoked = True
+        except IntegrityError:
+            db.session.rollback()
+            revoked = False
+
+        with self._lock:
+            self._revoked[jti] = expires_at
+        return revoked
@@ -0,0 +1,9 @@
+# Passed by the Procfile, Dockerfile and docker-compose via `-c api/gunicorn.conf.py`
+
+
+def post_worker_init(worker):
+    # Start background jobs only in workers that serve requests, never in
+    # `flask`/alembic processes that merely import the app.
+    from api.reminders import start_scheduler
+
+    start_scheduler(worker.wsgi)
@@ -0,0 +1,43 @@
+"""Due dates and reminders on todos
+
+Revision ID: 0002_todo_reminders
+Revises: 0001_initial
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_todo_reminders"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+PENDING = sa.text("remind_at IS NOT NULL AND reminded_at IS NULL")
+
+
+def upgrade() -> None:
+    op.add_column("todos", sa.Column("due_at", sa.DateTime(timezone=True)))
+    op.add_column("todos", sa.Column("remind_at", sa.DateTime(timezone=True)))
+    op.add_column("todos", sa.Column("claimed_until", sa.DateTime(timezone=True)))
+    op.add_column("todos", sa.Column("reminded_at", sa.DateTime(timezone=True)))
+    op.create_index(
+        "ix_todos_pending_reminders",
+        "todos",
+        ["remind_at"],
+        unique=False,
+        postgresql_where=PENDING,
+        sqlite_where=PENDING,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todos_pending_reminders", table_name="todos")
+    op.drop_column("todos", "reminded_at")
+    op.drop_column("todos", "claimed_until")
+    op.drop_column("todos", "remind_at")
+    op.drop_column("todos", "due_at")
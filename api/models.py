@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime, timezone
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index, text
 from werkzeug.security import generate_password_hash, check_password_hash
 from .db import db
 
@@ -48,10 +48,52 @@ class Todo(db.Model):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    remind_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Аренда: воркер, взявший напоминание, держит его до этого момента
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Проставляется только после успешной отправки — повторно не шлём
+    reminded_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id"), index=True, nullable=False
     )
     user: Mapped["User"] = relationship(back_populates="todos")
 
+    __table_args__ = (
+        # Частичный индекс: только ещё не отправленные напоминания
+        Index(
+            "ix_todos_pending_reminders",
+            "remind_at",
+            postgresql_where=text("remind_at IS NOT NULL AND reminded_at IS NULL"),
+            sqlite_where=text("remind_at IS NOT NULL AND reminded_at IS NULL"),
+        ),
+    )
+
     def to_dict(self) -> dict:
-        return {"id": self.id, "title": self.title, "done": self.done}
+        return {
+            "id": self.id,
+            "title": self.title,
+            "done": self.done,
+            "due_at": self.due_at.isoformat() if self.due_at else None,
+            "remind_at": self.remind_at.isoformat() if self.remind_at else None,
+        }
+
+
+class RevokedToken(db.Model):
+    __tablename__ = "revoked_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    jti: Mapped[str] = mapped_column(String(36), unique=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    # Истёкшие записи удаляет TokenDenylist при полной синхронизации
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), index=True, nullable=False
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
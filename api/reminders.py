@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import threading
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Protocol
+
+from sqlalchemy import or_, select, update
+
+from .db import db
+from .models import Todo
+
+logger = logging.getLogger(__name__)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; we always store UTC, so just attach tzinfo.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def pending_reminders(now: datetime):
+    # Same predicate as ix_todos_pending_reminders, so queries stay on the index;
+    # rows leased by a worker are skipped until the lease runs out.
+    return (
+        Todo.remind_at.isnot(None),
+        Todo.reminded_at.is_(None),
+        Todo.done.is_(False),
+        or_(Todo.claimed_until.is_(None), Todo.claimed_until <= now),
+    )
+
+
+class Notifier(Protocol):
+    def send(self, reminder: dict) -> None: ...
+
+
+class LogNotifier:
+    def send(self, reminder: dict) -> None:
+        logger.info("Reminder for todo %s: %s", reminder["id"], reminder["title"])
+
+
+class WebhookNotifier:
+    def __init__(self, url: str, timeout: float = 5.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, reminder: dict) -> None:
+        req = urllib.request.Request(
+            self.url,
+            data=json.dumps(reminder).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout):
+            pass
+
+
+class ReminderScheduler:
+    """Dispatches todo reminders from a background thread.
+
+    Only reminders due within ``window`` are kept in memory (a min-heap keyed by
+    ``remind_at``); the heap is refilled from the partial index instead of scanning
+    the table. Every gunicorn worker may run a scheduler: a reminder is sent only by
+    the worker that leases it with a conditional UPDATE. It is marked sent after the
+    notifier succeeds; a failed send is retried once the lease expires.
+    """
+
+    def __init__(
+        self,
+        app,
+        notifier: Notifier,
+        window: timedelta = timedelta(minutes=5),
+        refill_interval: timedelta = timedelta(seconds=30),
+        lease: timedelta = timedelta(minutes=2),
+        batch_size: int = 500,
+        clock: Callable[[], datetime] = utcnow,
+    ) -> None:
+        self.app = app
+        self.notifier = notifier
+        self.window = window
+        self.refill_interval = refill_interval
+        self.lease = lease
+        self.batch_size = batch_size
+        self.clock = clock
+
+        self._heap: list[tuple[datetime, int]] = []
+        self._queued: set[int] = set()
+        self._next_refill: datetime | None = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def refill(self, now: datetime) -> None:
+        stmt = (
+            select(Todo.id, Todo.remind_at)
+            .where(*pending_reminders(now), Todo.remind_at <= now + self.window)
+            .order_by(Todo.remind_at.asc())
+            .limit(self.batch_size)
+        )
+        rows = db.session.execute(stmt).all()
+
+        with self._lock:
+            for todo_id, remind_at in rows:
+                if todo_id not in self._queued:
+                    heapq.heappush(self._heap, (as_utc(remind_at), todo_id))
+                    self._queued.add(todo_id)
+
+        self._next_refill = now + self.refill_interval
+        if len(rows) == self.batch_size:
+            # The window holds more than one batch: load the rest once this one drains.
+            self._next_refill = min(self._next_refill, as_utc(rows[-1][1]))
+
+    def schedule(self, todo: Todo) -> None:
+        """Queue a todo created/updated by this worker without waiting for a refill."""
+        if todo.remind_at is None or todo.id is None:
+            return
+        remind_at = as_utc(todo.remind_at)
+        if remind_at > self.clock() + self.window:
+            return
+        with self._lock:
+            if todo.id in self._queued:
+                return
+            heapq.heappush(self._heap, (remind_at, todo.id))
+            self._queued.add(todo.id)
+        self._wake.set()
+
+    def _pop_due(self, now: datetime) -> list[int]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, todo_id = heapq.heappop(self._heap)
+                self._queued.discard(todo_id)
+                due.append(todo_id)
+        return due
+
+    def claim(self, todo_id: int, now: datetime) -> dict | None:
+        """Lease a due reminder to this worker and return its payload.
+
+        A single conditional UPDATE, atomic on both Postgres and SQLite: if another
+        worker holds the lease or already sent the reminder, no row matches and
+        None is returned.
+        """
+        result = db.session.execute(
+            update(Todo)
+            .where(Todo.id == todo_id, *pending_reminders(now), Todo.remind_at <= now)
+            .values(claimed_until=now + self.lease)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        if result.rowcount != 1:
+            return None
+        todo = db.session.get(Todo, todo_id)
+        return {**todo.to_dict(), "user_id": todo.user_id}
+
+    def mark_sent(self, todo_id: int, lease_until: datetime, now: datetime) -> bool:
+        # Only while this worker still holds the lease it sent under.
+        result = db.session.execute(
+            update(Todo)
+            .where(
+                Todo.id == todo_id,
+                Todo.claimed_until == lease_until,
+                Todo.reminded_at.is_(None),
+            )
+            .values(reminded_at=now, claimed_until=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount == 1
+
+    def dispatch_due(self, now: datetime) -> int:
+        due = self._pop_due(now)
+        sent = 0
+        for todo_id in due:
+            # Lease each reminder right before sending it, so a slow notifier can't
+            # outlive the leases of the rest of the batch.
+            leased_at = self.clock()
+            reminder = self.claim(todo_id, leased_at)
+            if reminder is None:
+                continue
+            lease_until = leased_at + self.lease
+            if self.clock() >= lease_until:
+                continue
+            try:
+                self.notifier.send(reminder)
+            except Exception as e:
+                # Left unsent: picked up again by a refill after the lease expires.
+                logger.warning("Reminder for todo %s failed: %s", reminder["id"], e)
+                continue
+            if self.mark_sent(todo_id, lease_until, self.clock()):
+                sent += 1
+            else:
+                logger.warning("Lease on reminder for todo %s expired", todo_id)
+        return sent
+
+    def run_once(self, now: datetime | None = None) -> int:
+        now = now or self.clock()
+        if self._next_refill is None or now >= self._next_refill:
+            self.refill(now)
+        return self.dispatch_due(now)
+
+    def _seconds_until_next(self, now: datetime) -> float:
+        wake_at = self._next_refill or now
+        with self._lock:
+            if self._heap:
+                wake_at = min(wake_at, self._heap[0][0])
+        return max((wake_at - now).total_seconds(), 0.0)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self.app.app_context():
+                try:
+                    self.run_once()
+                except Exception as e:
+                    db.session.rollback()
+                    logger.warning("Reminder scheduler error: %s", e)
+                finally:
+                    db.session.remove()
+            self._wake.wait(self._seconds_until_next(self.clock()) or 1.0)
+            self._wake.clear()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="reminder-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def start_scheduler(app) -> ReminderScheduler | None:
+    """Start the reminder scheduler for a serving process (see gunicorn.conf.py).
+
+    Not called from create_app(), so CLI commands and migrations that build the app
+    never spawn the thread. Each gunicorn worker runs its own scheduler; reminders
+    are leased in the DB, so they are still sent once.
+    """
+    enabled = app.config.get("REMINDERS_ENABLED")
+    if enabled is None:
+        enabled = os.environ.get("REMINDERS_ENABLED") == "1"
+    if not enabled or app.config.get("TESTING"):
+        return None
+
+    webhook_url = os.environ.get("REMINDER_WEBHOOK_URL")
+    notifier = WebhookNotifier(webhook_url) if webhook_url else LogNotifier()
+    scheduler = ReminderScheduler(app, notifier)
+    app.extensions["reminders"] = scheduler
+    scheduler.start()
+    return scheduler
@@ -1,7 +1,16 @@
 import re
 
-from flask import Blueprint, jsonify, request
-from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    get_jwt,
+    get_jwt_identity,
+    jwt_required,
+)
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 from werkzeug.exceptions import BadRequest
 
 from ..db import db
@@ -28,6 +37,13 @@ def validate_password(password: str) -> str | None:
     return None
 
 
+def issue_tokens(identity: str) -> dict:
+    return {
+        "token": create_access_token(identity=identity),
+        "refresh_token": create_refresh_token(identity=identity),
+    }
+
+
 @auth_bp.post("/api/auth/register")
 def register():
     try:
@@ -55,8 +71,7 @@ def register():
     db.session.add(user)
     db.session.commit()
 
-    token = create_access_token(identity=str(user.id))
-    return jsonify({"user": user.to_dict(), "token": token}), 201
+    return jsonify({"user": user.to_dict(), **issue_tokens(str(user.id))}), 201
 
 
 @auth_bp.post("/api/auth/login")
@@ -76,8 +91,41 @@ def login():
     user = User.query.filter_by(email=email).first()
     if not user or not user.check_password(password):
         return jsonify({"error": "invalid credentials"}), 401
-    token = create_access_token(identity=str(user.id))
-    return jsonify({"user": user.to_dict(), "token": token})
+    return jsonify({"user": user.to_dict(), **issue_tokens(str(user.id))})
+
+
+@auth_bp.post("/api/auth/refresh")
+@jwt_required(refresh=True)
+def refresh():
+    # Rotation: every refresh token works once. A replayed one loses the race on
+    # the unique jti, even if this worker's denylist hasn't synced yet.
+    denylist = current_app.extensions["token_denylist"]
+    if not denylist.revoke(get_jwt()):
+        return jsonify({"error": "token has been revoked"}), 401
+    return jsonify(issue_tokens(get_jwt_identity()))
+
+
+@auth_bp.post("/api/auth/logout")
+@jwt_required(verify_type=False)
+def logout():
+    # Clients authenticate with the refresh token: the 15-minute access token has
+    # usually expired by the time the user logs out.
+    denylist = current_app.extensions["token_denylist"]
+    denylist.revoke(get_jwt())
+
+    # The other token of the pair may be sent in the body; expired ones are skipped.
+    data = request.get_json(silent=True) or {}
+    for field in ("token", "refresh_token"):
+        raw = data.get(field)
+        if not raw:
+            continue
+        try:
+            claims = decode_token(raw)
+        except (JWTExtendedException, PyJWTError):
+            continue
+        if claims["sub"] == get_jwt_identity():
+            denylist.revoke(claims)
+    return ("", 204)
 
 
 @auth_bp.get("/api/me")
@@ -1,6 +1,7 @@
 import html
+from datetime import datetime, timezone
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from werkzeug.exceptions import BadRequest
 
@@ -14,6 +15,18 @@ def sanitize_title(raw: str) -> str:
     return html.escape(raw.strip())
 
 
+def parse_datetime(raw) -> datetime | None:
+    """Parse an ISO 8601 timestamp; naive values are treated as UTC."""
+    if raw is None or raw == "":
+        return None
+    if not isinstance(raw, str):
+        raise ValueError(raw)
+    value = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 @todos_bp.get("/api/todos")
 @jwt_required()
 def get_todos():
@@ -39,9 +52,20 @@ def add_todo():
     if len(title) > 100:
         return jsonify({"error": "title too long"}), 400
 
-    todo = Todo(title=title, done=False, user_id=uid)
+    dates = {}
+    for field in ("due_at", "remind_at"):
+        try:
+            dates[field] = parse_datetime(data.get(field))
+        except ValueError:
+            return jsonify({"error": f"invalid {field}"}), 400
+
+    todo = Todo(title=title, done=False, user_id=uid, **dates)
     db.session.add(todo)
     db.session.commit()
+
+    scheduler = current_app.extensions.get("reminders")
+    if scheduler is not None:
+        scheduler.schedule(todo)
     return jsonify(todo.to_dict()), 201
 
 
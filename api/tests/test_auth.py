@@ -1,5 +1,11 @@
+from datetime import timedelta
+
 from flask_jwt_extended import create_access_token
 
+from api.db import db
+from api.denylist import TokenDenylist
+from api.models import RevokedToken, User
+
 
 def test_register_returns_token(client):
     res = client.post(
@@ -97,3 +103,120 @@ def test_ping(client):
     res = client.get("/api/ping")
     assert res.status_code == 200
     assert res.data == b"pong"
+
+
+def _login(client, email="r@t.com", password="abc12345"):
+    client.post("/api/auth/register", json={"email": email, "password": password})
+    res = client.post("/api/auth/login", json={"email": email, "password": password})
+    assert res.status_code == 200
+    return res.get_json()
+
+
+def test_refresh_rotates_tokens(client):
+    tokens = _login(client)
+    old_refresh = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+
+    res = client.post("/api/auth/refresh", headers=old_refresh)
+    assert res.status_code == 200
+    new = res.get_json()
+    assert new["refresh_token"] != tokens["refresh_token"]
+
+    me = client.get("/api/me", headers={"Authorization": f"Bearer {new['token']}"})
+    assert me.status_code == 200
+
+    # The old refresh token was used once and is now revoked.
+    replay = client.post("/api/auth/refresh", headers=old_refresh)
+    assert replay.status_code == 401
+
+
+def test_refresh_rejects_access_token(client):
+    tokens = _login(client)
+    res = client.post(
+        "/api/auth/refresh", headers={"Authorization": f"Bearer {tokens['token']}"}
+    )
+    assert res.status_code == 422
+
+
+def test_logout_revokes_access_and_refresh_tokens(client):
+    tokens = _login(client)
+    access = {"Authorization": f"Bearer {tokens['token']}"}
+
+    res = client.post(
+        "/api/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers=access,
+    )
+    assert res.status_code == 204
+
+    assert client.get("/api/me", headers=access).status_code == 401
+    refresh = client.post(
+        "/api/auth/refresh",
+        headers={"Authorization": f"Bearer {tokens['refresh_token']}"},
+    )
+    assert refresh.status_code == 401
+
+
+def test_denylist_syncs_revocations_from_other_workers(app):
+    with app.app_context():
+        user = User(email="w@t.com")
+        user.set_password("abc12345")
+        db.session.add(user)
+        db.session.commit()
+        claims = {"jti": "jti-1", "sub": str(user.id), "exp": 4102444800}
+
+        worker_a = TokenDenylist()
+        worker_b = TokenDenylist()
+        assert worker_b.is_revoked("jti-1") is False
+
+        assert worker_a.revoke(claims) is True
+        assert worker_a.revoke(claims) is False
+        worker_b.sync()
+        assert worker_b.is_revoked("jti-1") is True
+
+
+def test_denylist_keeps_snapshot_when_db_fails(app):
+    with app.app_context():
+        user = User(email="f@t.com")
+        user.set_password("abc12345")
+        db.session.add(user)
+        db.session.commit()
+
+        # Revoked on another worker, then picked up by this worker's sync.
+        claims = {"jti": "jti-old", "sub": str(user.id), "exp": 4102444800}
+        TokenDenylist().revoke(claims)
+        denylist = TokenDenylist(sync_interval=timedelta(0))
+        denylist.sync()
+
+        # Every lookup now tries to sync and fails; the snapshot is still used.
+        RevokedToken.__table__.drop(db.engine)
+        assert denylist.is_revoked("jti-old") is True
+        assert denylist.is_revoked("jti-new") is False
+
+
+def test_full_sync_deletes_expired_rows(app):
+    with app.app_context():
+        user = User(email="p@t.com")
+        user.set_password("abc12345")
+        db.session.add(user)
+        db.session.commit()
+
+        denylist = TokenDenylist()
+        denylist.revoke({"jti": "expired", "sub": str(user.id), "exp": 1})
+        denylist.revoke({"jti": "live", "sub": str(user.id), "exp": 4102444800})
+        denylist.sync()
+
+        assert db.session.scalars(db.select(RevokedToken.jti)).all() == ["live"]
+        assert denylist.is_revoked("live") is True
+        assert denylist.is_revoked("expired") is False
+
+
+def test_logout_with_refresh_token_after_access_token_expired(app, client):
+    tokens = _login(client)
+    refresh = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+    with app.app_context():
+        expired = create_access_token(identity="1", expires_delta=timedelta(seconds=-1))
+
+    res = client.post("/api/auth/logout", json={"token": expired}, headers=refresh)
+    assert res.status_code == 204
+
+    assert client.post("/api/auth/refresh", headers=refresh).status_code == 401
@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta, timezone
+
+from api.db import db
+from api.models import Todo, User
+from api.reminders import ReminderScheduler
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, now=NOW):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, delta):
+        self.now += delta
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, reminder):
+        self.sent.append(reminder)
+
+
+def _add_todos(*remind_offsets):
+    user = User(email="r@b.com")
+    user.set_password("abc12345")
+    db.session.add(user)
+    db.session.flush()
+    todos = [
+        Todo(title=f"t{i}", user_id=user.id, remind_at=NOW + offset)
+        for i, offset in enumerate(remind_offsets)
+    ]
+    db.session.add_all(todos)
+    db.session.commit()
+    return [t.id for t in todos]
+
+
+def test_refill_loads_only_the_window(app):
+    with app.app_context():
+        near, _far = _add_todos(timedelta(minutes=1), timedelta(hours=2))
+        scheduler = ReminderScheduler(app, RecordingNotifier(), clock=FakeClock())
+        scheduler.refill(NOW)
+        assert [todo_id for _, todo_id in scheduler._heap] == [near]
+
+
+def test_due_reminder_is_sent_once(app):
+    with app.app_context():
+        (todo_id,) = _add_todos(timedelta(seconds=30))
+        clock = FakeClock()
+        notifier = RecordingNotifier()
+        scheduler = ReminderScheduler(app, notifier, clock=clock)
+
+        assert scheduler.run_once() == 0
+        clock.advance(timedelta(minutes=1))
+        assert scheduler.run_once() == 1
+        assert [r["id"] for r in notifier.sent] == [todo_id]
+
+        # A second worker that queued the same reminder must not resend it.
+        other = ReminderScheduler(app, notifier, clock=clock)
+        other.schedule(db.session.get(Todo, todo_id))
+        assert other.dispatch_due(clock()) == 0
+        assert len(notifier.sent) == 1
+
+
+def test_done_todo_is_not_reminded(app):
+    with app.app_context():
+        (todo_id,) = _add_todos(timedelta(seconds=30))
+        db.session.get(Todo, todo_id).done = True
+        db.session.commit()
+
+        notifier = RecordingNotifier()
+        clock = FakeClock(NOW + timedelta(minutes=1))
+        scheduler = ReminderScheduler(app, notifier, clock=clock)
+        assert scheduler.run_once() == 0
+        assert notifier.sent == []
+
+
+def test_failed_send_is_retried_after_lease(app):
+    class FlakyNotifier(RecordingNotifier):
+        def send(self, reminder):
+            if not self.sent and not getattr(self, "failed", False):
+                self.failed = True
+                raise OSError("webhook down")
+            super().send(reminder)
+
+    with app.app_context():
+        (todo_id,) = _add_todos(timedelta(seconds=30))
+        clock = FakeClock(NOW + timedelta(minutes=1))
+        notifier = FlakyNotifier()
+        scheduler = ReminderScheduler(
+            app, notifier, lease=timedelta(minutes=2), clock=clock
+        )
+
+        assert scheduler.run_once() == 0
+        assert db.session.get(Todo, todo_id).reminded_at is None
+
+        # Still leased: neither this nor another worker resends it yet.
+        clock.advance(timedelta(minutes=1))
+        other = ReminderScheduler(app, notifier, clock=clock)
+        assert other.run_once() == 0
+
+        clock.advance(timedelta(minutes=2))
+        assert scheduler.run_once() == 1
+        assert [r["id"] for r in notifier.sent] == [todo_id]
+        db.session.expire_all()
+        assert db.session.get(Todo, todo_id).reminded_at is not None
+
+
+def test_claim_is_exclusive_between_workers(app):
+    with app.app_context():
+        (todo_id,) = _add_todos(timedelta(seconds=30))
+        worker_a = ReminderScheduler(app, RecordingNotifier())
+        worker_b = ReminderScheduler(app, RecordingNotifier())
+
+        now = NOW + timedelta(minutes=1)
+        assert worker_a.claim(todo_id, now)["id"] == todo_id
+        assert worker_b.claim(todo_id, now) is None
+
+
+def test_slow_batch_outliving_the_lease_is_not_sent_twice(app):
+    sent = []
+
+    class SlowNotifier:
+        def __init__(self, name, during_second_send=None):
+            self.name = name
+            self.during_second_send = during_second_send
+
+        def send(self, reminder):
+            clock.advance(timedelta(seconds=90))
+            sent.append((self.name, reminder["id"]))
+            if len(sent) == 2 and self.during_second_send:
+                self.during_second_send()
+
+    with app.app_context():
+        ids = _add_todos(*[timedelta(seconds=s) for s in (10, 20, 30)])
+        clock = FakeClock(NOW + timedelta(minutes=1))
+        lease = timedelta(minutes=2)
+        worker_b = ReminderScheduler(app, SlowNotifier("B"), lease=lease, clock=clock)
+        # B refills 3 minutes into A's batch, past a lease taken when it started.
+        worker_a = ReminderScheduler(
+            app,
+            SlowNotifier("A", during_second_send=worker_b.run_once),
+            lease=lease,
+            clock=clock,
+        )
+
+        worker_a.run_once()
+
+        assert sorted(todo_id for _, todo_id in sent) == ids
+        db.session.expire_all()
+        assert all(db.session.get(Todo, i).reminded_at is not None for i in ids)
@@ -92,3 +92,29 @@ def test_todo_invalid_json(client):
     )
     assert res.status_code == 400
     assert res.get_json() == {"error": "Invalid JSON"}
+
+
+def test_todo_with_due_and_remind_dates(client):
+    headers = _auth_headers(client)
+    res = client.post(
+        "/api/todos",
+        json={
+            "title": "pay rent",
+            "due_at": "2026-02-01T09:00:00+02:00",
+            "remind_at": "2026-02-01T06:00:00Z",
+        },
+        headers=headers,
+    )
+    assert res.status_code == 201
+    todo = res.get_json()
+    assert todo["due_at"].startswith("2026-02-01T07:00:00")
+    assert todo["remind_at"].startswith("2026-02-01T06:00:00")
+
+
+def test_todo_invalid_due_at(client):
+    headers = _auth_headers(client)
+    res = client.post(
+        "/api/todos", json={"title": "a", "due_at": "tomorrow"}, headers=headers
+    )
+    assert res.status_code == 400
+    assert res.get_json() == {"error": "invalid due_at"}
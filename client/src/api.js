@@ -11,7 +11,62 @@ export function setToken(token) {
   else localStorage.removeItem('token')
 }
 
-export async function apiFetch(path, opts = {}) {
+export function getRefreshToken() {
+  return localStorage.getItem('refresh_token') || ''
+}
+
+export function setRefreshToken(token) {
+  if (token) localStorage.setItem('refresh_token', token)
+  else localStorage.removeItem('refresh_token')
+}
+
+// Access tokens are short-lived: swap the refresh token for a new pair (it works once,
+// so concurrent 401s must share one refresh instead of each sending the same token)
+let refreshInFlight = null
+
+async function requestNewTokens() {
+  const refreshToken = getRefreshToken()
+  if (!refreshToken) return false
+
+  try {
+    const res = await fetch(`${API_BASE}/api/auth/refresh`, {
+      method: 'POST',
+      headers: { Authorization: `Bearer ${refreshToken}` },
+    })
+    if (!res.ok) return false
+
+    const data = await res.json()
+    setToken(data.token)
+    setRefreshToken(data.refresh_token)
+    return true
+  } catch {
+    return false
+  }
+}
+
+function refreshTokens() {
+  if (!refreshInFlight) {
+    refreshInFlight = requestNewTokens().finally(() => {
+      refreshInFlight = null
+    })
+  }
+  return refreshInFlight
+}
+
+// Logout authenticates with the refresh token (the access token has often expired)
+// and bypasses apiFetch so a 401 never triggers a refresh
+export function revokeSession(refreshToken, accessToken) {
+  return fetch(`${API_BASE}/api/auth/logout`, {
+    method: 'POST',
+    headers: {
+      Authorization: `Bearer ${refreshToken}`,
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ token: accessToken }),
+  })
+}
+
+export async function apiFetch(path, opts = {}, retried = false) {
   const url = path.startsWith('http') ? path : `${API_BASE}${path}`
   const headers = { ...(opts.headers || {}) }
 
@@ -21,9 +76,16 @@ export async function apiFetch(path, opts = {}) {
 
   const res = await fetch(url, { ...opts, headers })
 
+  if (res.status === 401 && token && !retried) {
+    // The pair may already have been rotated by a request that failed earlier
+    const refreshed = getToken() !== token || (await refreshTokens())
+    if (refreshed) return apiFetch(path, opts, true)
+  }
+
   // Global auto logout
   if (res.status === 401) {
     setToken('')
+    setRefreshToken('')
     if (!location.pathname.startsWith('/login')) {
       window.location.assign('/login') // в api.js нельзя useNavigate
     }
@@ -0,0 +1,40 @@
+import { afterEach, beforeEach, expect, test, vi } from 'vitest'
+import { apiFetch, getRefreshToken, getToken } from './api'
+
+function jsonResponse(status, body = {}) {
+  return Promise.resolve({ ok: status < 400, status, json: async () => body })
+}
+
+beforeEach(() => {
+  localStorage.setItem('token', 'expired-access')
+  localStorage.setItem('refresh_token', 'refresh-1')
+})
+
+afterEach(() => {
+  localStorage.clear()
+  vi.unstubAllGlobals()
+})
+
+test('concurrent 401s share a single refresh', async () => {
+  const fetchMock = vi.fn((url, opts = {}) => {
+    if (url === '/api/auth/refresh') {
+      return jsonResponse(200, { token: 'access-2', refresh_token: 'refresh-2' })
+    }
+    if (opts.headers.Authorization === 'Bearer access-2') {
+      return jsonResponse(200, { id: 1 })
+    }
+    return jsonResponse(401)
+  })
+  vi.stubGlobal('fetch', fetchMock)
+
+  const results = await Promise.all([
+    apiFetch('/api/todos/1', { method: 'PATCH' }),
+    apiFetch('/api/todos/2', { method: 'PATCH' }),
+  ])
+
+  expect(results.map(r => r.status)).toEqual([200, 200])
+  const refreshCalls = fetchMock.mock.calls.filter(([url]) => url === '/api/auth/refresh')
+  expect(refreshCalls).toHaveLength(1)
+  expect(getToken()).toBe('access-2')
+  expect(getRefreshToken()).toBe('refresh-2')
+})
@@ -1,5 +1,12 @@
 import { createContext, useContext, useEffect, useState } from 'react'
-import { apiFetch, getToken, setToken } from '../api'
+import {
+  apiFetch,
+  getRefreshToken,
+  getToken,
+  revokeSession,
+  setRefreshToken,
+  setToken,
+} from '../api'
 
 const AuthContext = createContext(null)
 
@@ -56,6 +63,7 @@ export function AuthProvider({ children }) {
       throw new Error('Invalid response from server')
     }
     setToken(data.token)
+    setRefreshToken(data.refresh_token)
     setUser(data.user)
   }
 
@@ -72,11 +80,18 @@ export function AuthProvider({ children }) {
       throw new Error('Invalid response from server')
     }
     setToken(data.token)
+    setRefreshToken(data.refresh_token)
     setUser(data.user)
   }
 
   const logout = () => {
+    // Revoke both tokens server-side; local state is cleared either way
+    const refreshToken = getRefreshToken()
+    if (refreshToken) {
+      revokeSession(refreshToken, getToken()).catch(() => {})
+    }
     setToken('')
+    setRefreshToken('')
     setUser(null)
   }
 
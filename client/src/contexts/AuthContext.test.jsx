@@ -8,6 +8,9 @@ vi.mock('../api', () => ({
   apiFetch: vi.fn(),
   getToken: vi.fn(() => ''),
   setToken: vi.fn(),
+  getRefreshToken: vi.fn(() => ''),
+  setRefreshToken: vi.fn(),
+  revokeSession: vi.fn(() => Promise.resolve()),
 }))
 
 function Harness() {